@@ -1,4 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable, Iterator
 
 from dagster import (
     config_from_files,
@@ -11,20 +13,20 @@ from dagster import (
     job,
 )
 
-from mpyl.project import load_project, Project
-from mpyl.stages.discovery import find_projects_to_execute
+from mpyl.project import load_project, load_project_header, Project, ProjectHeader
+from mpyl.stages.discovery import find_candidate_headers, find_projects_to_execute
 from mpyl.steps import build, test, deploy
 from mpyl.steps.collection import StepsCollection
 from mpyl.steps.run_properties import construct_run_properties
 from mpyl.steps.steps import Steps, StepResult
-from mpyl.utilities.pyaml_env import parse_config
-from mpyl.utilities.repo import Repository, RepoConfig
+from mpyl.utilities.config_cache import load_config_cached
+from mpyl.utilities.repo import Changeset, Repository, RepoConfig
 
 ROOT_PATH = "./"
 
 
 def execute_step(proj: Project, stage: str, dry_run: bool = True) -> StepResult:
-    config = parse_config(Path(f"{ROOT_PATH}mpyl_config.yml"))
+    config = load_config_cached(Path(f"{ROOT_PATH}mpyl_config.yml"))
     run_properties = construct_run_properties(
         config=config, properties={}, run_plan=RunPlan.empty()
     )
@@ -72,57 +74,81 @@ def deploy_projects(
     return Output(res)
 
 
-def find_projects(stage: str) -> list[DynamicOutput[Project]]:
-    yaml_values = parse_config(Path(f"{ROOT_PATH}mpyl_config.yml"))
+def _discovery_snapshot() -> tuple[Changeset, set[ProjectHeader]]:
+    """Changes and project headers in the repository, shared by the discovery of all stages"""
+    yaml_values = load_config_cached(Path(f"{ROOT_PATH}mpyl_config.yml"))
     with Repository(RepoConfig.from_config(yaml_values)) as repo:
         changes_in_branch = repo.changes_in_branch_including_local()
         project_paths = repo.find_projects()
-    all_projects = set(
-        map(lambda p: load_project(Path("."), Path(p), strict=False), project_paths)
-    )
-    dagster_logger = get_dagster_logger()
-    steps = StepsCollection(logger=dagster_logger)
-    project_executions = find_projects_to_execute(
-        logger=dagster_logger,
-        all_projects=all_projects,
-        stage=stage,
-        changeset=changes_in_branch,
-        steps=steps,
-    )
-    return list(
-        map(
-            lambda project: DynamicOutput(
-                project, mapping_key=project.name.replace("-", "_")
-            ),
-            project_executions,
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(32, len(project_paths)))
+    ) as executor:
+        headers = set(
+            executor.map(
+                lambda p: load_project_header(Path("."), Path(p)), project_paths
+            )
         )
-    )
+    return changes_in_branch, headers
 
 
-@op(out=DynamicOut(), description="Find artifacts that need to be built")
-def find_build_projects() -> list[DynamicOutput[Project]]:
-    return find_projects(build.STAGE_NAME)
+def to_dynamic_outputs(
+    output_name: str, projects: Iterable[Project]
+) -> Iterator[DynamicOutput[Project]]:
+    for project in projects:
+        yield DynamicOutput(
+            project,
+            mapping_key=project.name.replace("-", "_"),
+            output_name=output_name,
+        )
 
 
-@op(out=DynamicOut(), description="Find artifacts that need to be tested")
-def find_test_projects(_projects) -> list[DynamicOutput[Project]]:
-    return find_projects(test.STAGE_NAME)
+@op(
+    out={
+        build.STAGE_NAME: DynamicOut(),
+        test.STAGE_NAME: DynamicOut(),
+        deploy.STAGE_NAME: DynamicOut(),
+    },
+    description="Find the artifacts that need to be built, tested and deployed",
+)
+def discover_plan() -> Iterator[DynamicOutput[Project]]:
+    changes_in_branch, headers = _discovery_snapshot()
+    dagster_logger = get_dagster_logger()
+    steps = StepsCollection(logger=dagster_logger)
+    loaded: dict[str, Project] = {}
+    for stage in [build.STAGE_NAME, test.STAGE_NAME, deploy.STAGE_NAME]:
+        candidates = find_candidate_headers(headers, stage, changes_in_branch)
+        for header in candidates:
+            if header.path not in loaded:
+                loaded[header.path] = load_project(
+                    Path("."), Path(header.path), strict=False
+                )
+        project_executions = find_projects_to_execute(
+            logger=dagster_logger,
+            all_projects={loaded[header.path] for header in candidates},
+            stage=stage,
+            changeset=changes_in_branch,
+            steps=steps,
+        )
+        yield from to_dynamic_outputs(stage, project_executions)
 
 
-@op(out=DynamicOut(), description="Find artifacts that need to be deployed")
-def find_deploy_projects(_projects) -> list[DynamicOutput[Project]]:
-    return find_projects(deploy.STAGE_NAME)
+@op(
+    out=DynamicOut(), description="Release the projects once the previous stage is done"
+)
+def after_previous_stage(
+    projects: list[Project], _results: list[StepResult]
+) -> Iterator[DynamicOutput[Project]]:
+    yield from to_dynamic_outputs("result", projects)
 
 
 @job(config=config_from_files(["mpyl-dagster-example.yml"]))
 def run_build():
-    build_projects = find_build_projects()
+    build_projects, test_projects, projects_to_deploy = discover_plan()
     build_results = build_projects.map(build_project)
 
-    test_projects = find_test_projects(build_results.collect())
-    test_results = test_projects.map(test_project)
-
-    projects_to_deploy = find_deploy_projects(test_projects.collect())
+    test_results = after_previous_stage(
+        test_projects.collect(), build_results.collect()
+    ).map(test_project)
 
     deploy_projects(
         projects=projects_to_deploy.collect(), outputs=test_results.collect()
@@ -4,6 +4,7 @@ import asyncio
 import importlib
 import logging
 from dataclasses import dataclass
+from functools import cache
 from importlib.metadata import version as version_meta
 from pathlib import Path
 from typing import Optional
@@ -86,7 +87,9 @@ async def check_updates(meta: str) -> Optional[str]:
     return None
 
 
+@cache
 def get_version():
+    """The version of the installed MPyL package. Looked up once, because it cannot change while running."""
     try:
         return f"{version_meta('mpyl')}"
     except importlib.metadata.PackageNotFoundError:
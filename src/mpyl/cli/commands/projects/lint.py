@@ -71,7 +71,7 @@ def _assert_project_ids(console: Console, all_projects: list[Project]):
     missing_ids = [
         project.name
         for project in all_projects
-        if project.stages.for_stage(STAGE_NAME) is not None
+        if project.has_stage(STAGE_NAME)
         and "override" not in project.path
         and project.deployment
         and project.deployment.kubernetes
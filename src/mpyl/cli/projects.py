@@ -1,5 +1,6 @@
 """Commands related to projects and how they relate"""
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -30,7 +31,7 @@ from ..constants import DEFAULT_CONFIG_FILE_NAME
 from ..project import load_project, Target
 from ..projects.versioning import (
     check_upgrades_needed,
-    upgrade_file,
+    upgrade_files,
     PROJECT_UPGRADERS,
 )
 from ..utilities.pyaml_env import parse_config
@@ -39,6 +40,8 @@ from ..utilities.repo import Repository, RepoConfig
 
 @dataclass
 class ProjectsContext:
+    __slots__ = ("cli", "filter")
+
     cli: CliContext
     filter: str
 
@@ -89,9 +92,13 @@ OVERRIDE_PATTERN = "project-override"
 def list_projects(obj: ProjectsContext):
     found_projects = obj.cli.repo.find_projects(obj.filter)
 
-    for proj in found_projects:
-        project = load_project(obj.cli.repo.root_dir, Path(proj), False)
-        obj.cli.console.print(Markdown(f"{proj} `{project.name}`"))
+    with ThreadPoolExecutor() as executor:
+        loaded = executor.map(
+            lambda proj: load_project(obj.cli.repo.root_dir, Path(proj), False),
+            found_projects,
+        )
+        for proj, project in zip(found_projects, loaded):
+            obj.cli.console.print(Markdown(f"{proj} `{project.name}`"))
 
 
 @projects.command(name="names", help="List found project names")
@@ -265,9 +272,10 @@ def upgrade(obj: ProjectsContext, apply: bool):
         status.stop()
         if number_of_upgrades > 0 and Confirm.ask("Upgrade all?"):
             status.start()
-            for path in need_upgrade:
-                status.update(f"Upgrading {path}")
-                upgraded = upgrade_file(path, PROJECT_UPGRADERS)
+            status.update(f"Upgrading {number_of_upgrades} projects")
+            for path, upgraded in zip(
+                need_upgrade, upgrade_files(need_upgrade, PROJECT_UPGRADERS)
+            ):
                 if upgraded:
                     path.write_text(upgraded)
             status.stop()
@@ -13,12 +13,17 @@ in the `deployment/project.yml`. It defines how the source code to which it rela
 .. include:: ../../README-dev.md
 """
 
+import copy
+import hashlib
 import logging
 import pkgutil
+import threading
 import time
 import traceback
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import Optional, TypeVar, Any, List
 
@@ -151,6 +156,16 @@ class Stages(StageSpecificProperty[str]):
     def all(self) -> dict[str, Optional[str]]:
         return self.stages
 
+    def has(self, stage: str) -> bool:
+        """:return: whether a step is defined for `stage`"""
+        return stage in self._defined
+
+    @cached_property
+    def _defined(self) -> frozenset[str]:
+        return frozenset(
+            stage for stage, step in self.stages.items() if step is not None
+        )
+
     @staticmethod
     def from_config(values: dict):
         return Stages(values)
@@ -163,8 +178,31 @@ class Dependencies(StageSpecificProperty[set[str]]):
         return deps_for_stage if deps_for_stage else set()
 
     def all(self) -> dict[str, set[str]]:
+        return self._by_stage
+
+    @cached_property
+    def _by_stage(self) -> dict[str, set[str]]:
         return {key: self.set_for_stage(key) for key in self.stages.keys()}
 
+    def prefixes(self) -> dict[str, tuple[str, ...]]:
+        """
+        :return: the dependencies per stage in sorted order, without the paths that are already covered by a
+        shorter dependency. No remaining dependency is a prefix of another, so the only one that can be a prefix of a
+        path is the one that sorts right before it.
+        """
+        return self._prefixes_by_stage
+
+    @cached_property
+    def _prefixes_by_stage(self) -> dict[str, tuple[str, ...]]:
+        prefixes_by_stage: dict[str, tuple[str, ...]] = {}
+        for stage, dependencies in self.all().items():
+            prefixes: list[str] = []
+            for dependency in sorted(dependencies):
+                if not prefixes or not dependency.startswith(prefixes[-1]):
+                    prefixes.append(dependency)
+            prefixes_by_stage[stage] = tuple(prefixes)
+        return prefixes_by_stage
+
     @staticmethod
     def from_config(values: dict):
         return Dependencies(values)
@@ -518,6 +556,9 @@ class Project:
     def __hash__(self):
         return hash(self.path)
 
+    def has_stage(self, stage: str) -> bool:
+        return self.stages.has(stage)
+
     @property
     def to_name(self) -> ProjectName:
         return ProjectName(
@@ -610,6 +651,41 @@ class Project:
         )
 
 
+@dataclass(frozen=True)
+class ProjectHeader:
+    """The subset of a `Project` that is needed to find out whether it is affected by changed files"""
+
+    name: str
+    path: str
+    stages: Stages
+    dependencies: Optional[Dependencies]
+
+    def __eq__(self, other):
+        return self.path == other.path
+
+    def __hash__(self):
+        return hash(self.path)
+
+    def has_stage(self, stage: str) -> bool:
+        return self.stages.has(stage)
+
+    @property
+    def root_path(self) -> Path:
+        return Path(self.path).parent.parent
+
+    @staticmethod
+    def from_config(values: dict, project_path: Path):
+        dependencies = values.get("dependencies")
+        return ProjectHeader(
+            name=values["name"],
+            path=str(project_path),
+            stages=Stages.from_config(values.get("stages", {})),
+            dependencies=(
+                Dependencies.from_config(dependencies) if dependencies else None
+            ),
+        )
+
+
 def validate_project(yaml_values: dict, root_dir: Path) -> dict:
     """
     :type yaml_values: the yaml dictionary to validate
@@ -625,20 +701,71 @@ def validate_project(yaml_values: dict, root_dir: Path) -> dict:
     return yaml_values
 
 
-def load_possible_parent(
-    full_path: Path,
-    loader: YAML,
-) -> Optional[dict]:
+def _parent_project_path(full_path: Path) -> Optional[Path]:
     parent_project_path = full_path.parent / Project.project_yaml_file_name()
     if (
         str(full_path).endswith(Project.project_yaml_file_name())
         or not parent_project_path.exists()
     ):
         return None
+    return parent_project_path
+
+
+def load_possible_parent(
+    full_path: Path,
+    loader: YAML,
+) -> Optional[dict]:
+    parent_project_path = _parent_project_path(full_path)
+    if parent_project_path is None:
+        return None
     with open(parent_project_path, encoding="utf-8") as file:
         return loader.load(file)
 
 
+_loaders = threading.local()
+
+
+def _loader(typ: Optional[str]) -> YAML:
+    """A `YAML` instance of type `typ` that is reused by all project loads on the current thread. Instances are not
+    thread safe, so they are not shared across threads."""
+    loaders: dict[Optional[str], YAML] = _loaders.__dict__.setdefault("by_type", {})
+    loader = loaders.get(typ)
+    if loader is None:
+        loader = loaders[typ] = YAML(typ=typ)
+    return loader
+
+
+_PROJECT_CACHE_SIZE = 512
+_project_cache: OrderedDict[tuple, Project] = OrderedDict()
+_project_cache_lock = threading.Lock()
+
+
+def _content_hash(full_path: Path) -> str:
+    digest = hashlib.sha1(full_path.read_bytes())
+    if parent_project_path := _parent_project_path(full_path):
+        digest.update(parent_project_path.read_bytes())
+    return digest.hexdigest()
+
+
+def _cached_project(key: tuple) -> Optional[Project]:
+    with _project_cache_lock:
+        project = _project_cache.get(key)
+        if project is None:
+            return None
+        _project_cache.move_to_end(key)
+    # nested values of a project are mutable and are altered downstream, e.g. while building charts
+    return copy.deepcopy(project)
+
+
+def _cache_project(key: tuple, project: Project) -> None:
+    project = copy.deepcopy(project)
+    with _project_cache_lock:
+        _project_cache[key] = project
+        _project_cache.move_to_end(key)
+        if len(_project_cache) > _PROJECT_CACHE_SIZE:
+            _project_cache.popitem(last=False)
+
+
 def load_project(
     root_dir: Path,
     project_path: Path,
@@ -647,7 +774,8 @@ def load_project(
     safe: bool = False,
 ) -> Project:
     """
-    Load a `project.yml` to `Project` data class
+    Load a `project.yml` to `Project` data class. Loaded projects are cached per process by the hash of their
+    (and their parent's) file contents, so loading an unchanged file twice parses it only once.
     :param root_dir: is the root of the project path. It contains the mpyl_config.yml and run_properties.yml files
     :param project_path: relative path from `root_dir` to the `project.yml`
     :param strict: indicates whether the schema should be validated
@@ -656,12 +784,36 @@ def load_project(
     when the values possibly end up in artifacts
     :return: `Project` data class
     """
+    full_path = root_dir / project_path
+    try:
+        content_hash = _content_hash(full_path)
+    except OSError:
+        return _load_project(root_dir, project_path, strict, log, safe)
+
+    key = (str(root_dir), str(project_path), content_hash, strict, safe)
+    # a schema validated project is equally valid when loaded without validation
+    project = _cached_project(key) or (
+        None if strict else _cached_project(key[:3] + (True, safe))
+    )
+    if project is None:
+        project = _load_project(root_dir, project_path, strict, log, safe)
+        _cache_project(key, project)
+    return project
+
+
+def _load_project(
+    root_dir: Path,
+    project_path: Path,
+    strict: bool,
+    log: bool,
+    safe: bool,
+) -> Project:
     log_level = logging.WARNING if log else logging.DEBUG
     full_path = root_dir / project_path
     with open(full_path, encoding="utf-8") as file:
         try:
             start = time.time()
-            loader: YAML = YAML(typ=None if safe else "unsafe")
+            loader = _loader(None if safe else "unsafe")
             yaml_values: dict = loader.load(file)
             parent_yaml_values: Optional[dict] = load_possible_parent(full_path, loader)
             yaml_values = merge_dicts(yaml_values, parent_yaml_values, True)
@@ -686,6 +838,21 @@ def load_project(
             raise
 
 
+def load_project_header(root_dir: Path, project_path: Path) -> ProjectHeader:
+    """
+    Load only the name, stages and dependencies of a `project.yml`, without schema validation. Use `load_project`
+    for the projects that turn out to be relevant.
+    """
+    full_path = root_dir / project_path
+    loader = _loader("safe")
+    with open(full_path, encoding="utf-8") as file:
+        yaml_values: dict = loader.load(file)
+    parent_yaml_values = load_possible_parent(full_path, loader)
+    return ProjectHeader.from_config(
+        merge_dicts(yaml_values, parent_yaml_values, True), project_path
+    )
+
+
 def merge_dicts(
     yaml_values: dict, parent_yaml_values: Optional[dict], root_level=False
 ) -> dict:
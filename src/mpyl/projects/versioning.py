@@ -8,10 +8,13 @@ list in this module.
 """
 import copy
 import numbers
+import os
 import pkgutil
 import re
 from abc import ABC
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import cache, partial
 from pathlib import Path
 from typing import Generator
 from typing import Optional
@@ -24,6 +27,8 @@ from ..utilities.yaml import yaml_to_string, load_for_roundtrip, yaml_for_roundt
 VERSION_FIELD = "mpylVersion"
 BASE_RELEASE = "1.0.8"
 
+_ROUNDTRIP_YAML = yaml_for_roundtrip()
+
 
 @dataclass
 class Release:
@@ -49,6 +54,7 @@ class Release:
         )
 
 
+@cache
 def get_releases() -> list[Release]:
     embedded_releases = pkgutil.get_data(__name__, "releases/releases.txt")
     if not embedded_releases:
@@ -65,6 +71,7 @@ def add_release(release: Release) -> None:
     releases_path = Path(__file__).parent / "releases/releases.txt"
     with open(releases_path, "a", encoding="utf-8") as releases_file:
         releases_file.write(str(f"\n{release}"))
+    get_releases.cache_clear()
 
 
 def get_release_notes_base_path():
@@ -359,6 +366,7 @@ def __get_version(project: dict) -> str:
 def upgrade_to_latest(
     to_upgrade: ordereddict, upgraders: list[Upgrader]
 ) -> ordereddict:
+    """Upgrades `to_upgrade` in place. The version field is only bumped by upgraders that changed something."""
     upgrade_index = get_entry_upgrader_index(__get_version(to_upgrade), upgraders)
     if upgrade_index is None:
         return to_upgrade
@@ -367,17 +375,15 @@ def upgrade_to_latest(
     for i in range(upgrade_index, len(upgraders)):
         upgrader = upgraders[i]
         before_upgrade = copy.deepcopy(upgraded)
-        upgraded = upgrader.upgrade(copy.deepcopy(before_upgrade))
-        diff = DeepDiff(before_upgrade, upgraded, ignore_order=True, view="tree")
-        if diff:
+        upgraded = upgrader.upgrade(upgraded)
+        if upgraded != before_upgrade:
             upgraded[VERSION_FIELD] = upgrader.target_version
     return upgraded
 
 
 def pretty_print_value(value) -> str:
-    print_yaml = yaml_for_roundtrip()
     if isinstance(value, (dict, list, set)):
-        return f"\n```\n{yaml_to_string(value, print_yaml)}```"
+        return f"\n```\n{yaml_to_string(value, _ROUNDTRIP_YAML)}```"
     return f"`{value}`\n"
 
 
@@ -407,8 +413,8 @@ def check_upgrades_needed(
 def check_upgrade_needed(
     file_path: Path, upgraders: list[Upgrader]
 ) -> tuple[Path, Optional[DeepDiff]]:
-    loaded, _ = load_for_roundtrip(file_path)
-    upgraded = upgrade_to_latest(loaded, upgraders)
+    loaded, _ = load_for_roundtrip(file_path, _ROUNDTRIP_YAML)
+    upgraded = upgrade_to_latest(copy.deepcopy(loaded), upgraders)
     diff = DeepDiff(loaded, upgraded, ignore_order=True, view="_delta")
     if diff:
         return file_path, diff
@@ -416,6 +422,25 @@ def check_upgrade_needed(
 
 
 def upgrade_file(project_file: Path, upgraders: list[Upgrader]) -> Optional[str]:
-    to_upgrade, yaml = load_for_roundtrip(project_file)
-    upgraded = upgrade_to_latest(copy.deepcopy(to_upgrade), upgraders)
+    to_upgrade, yaml = load_for_roundtrip(project_file, _ROUNDTRIP_YAML)
+    upgraded = upgrade_to_latest(to_upgrade, upgraders)
     return yaml_to_string(upgraded, yaml)
+
+
+def upgrade_files(
+    project_files: list[Path], upgraders: list[Upgrader]
+) -> list[Optional[str]]:
+    """Upgrades `project_files` in parallel over a process pool. Results are in the same order as the input."""
+    if len(project_files) < 2:
+        return [upgrade_file(path, upgraders) for path in project_files]
+
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(project_files) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                partial(upgrade_file, upgraders=upgraders),
+                project_files,
+                chunksize=chunksize,
+            )
+        )
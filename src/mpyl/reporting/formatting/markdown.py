@@ -34,10 +34,12 @@ def __add_link_if_service(name: str, output: Output) -> str:
     return name
 
 
-def wrap_project_name(project_execution: ProjectExecution, result: list[StepResult]):
+def wrap_project_name(
+    project_execution: ProjectExecution, results_by_name: dict[str, StepResult]
+):
     project_name = project_execution.name
     encapsulation = "_"
-    found_result = next((r for r in result if r.project.name == project_name), None)
+    found_result = results_by_name.get(project_name)
     if found_result:
         project_name = __add_link_if_service(project_name, found_result.output)
         encapsulation = "*" if found_result.output.success else "~~"
@@ -50,9 +52,11 @@ def __to_oneliner(
 ) -> str:
     project_names: list[str] = []
     if plan:
+        # reversed, so that the first result for a project takes precedence
+        results_by_name = {r.project.name: r for r in reversed(result)}
         sorted_plans = sorted(plan, key=operator.attrgetter("name"))
         for project_execution in sorted_plans:
-            project_names.append(wrap_project_name(project_execution, result))
+            project_names.append(wrap_project_name(project_execution, results_by_name))
     else:
         project_names = list(map(lambda r: f"_{r.project.name}_", result))
 
@@ -65,7 +69,9 @@ def markdown_for_stage(run_result: RunResult, stage: Stage):
     if not step_results and not plan:
         return ""
 
-    result = f"{stage.icon} {stage.name.capitalize()}:  \n{__to_oneliner(step_results, plan)}  \n"
+    parts = [
+        f"{stage.icon} {stage.name.capitalize()}:  \n{__to_oneliner(step_results, plan)}  \n"
+    ]
     test_artifacts: dict[str, JunitTestSpec] = _collect_test_specs(step_results)
     test_results: dict[str, TestRunSummary] = _collect_test_results(test_artifacts)
 
@@ -77,18 +83,18 @@ def markdown_for_stage(run_result: RunResult, stage: Stage):
             errors=sum(s.errors for s in test_summaries),
             skipped=sum(s.skipped for s in test_summaries),
         )
-        result += f"{summary_to_markdown(combined_summary)}"
+        parts.append(summary_to_markdown(combined_summary))
         unique_artifacts = _collect_unique_test_artifacts_with_url(test_artifacts)
 
         for unique_artifact in unique_artifacts:
-            result += (
+            parts.append(
                 f" [{unique_artifact.test_results_url_name}]"
                 f"({unique_artifact.test_results_url})"
             )
 
-        result += "  \n"
+        parts.append("  \n")
 
-    return result
+    return "".join(parts)
 
 
 def run_result_to_markdown(run_result: RunResult) -> str:
@@ -97,11 +103,13 @@ def run_result_to_markdown(run_result: RunResult) -> str:
 
 
 def execution_plan_as_markdown(run_result: RunResult):
-    result = ""
+    parts: list[str] = []
     exception = run_result.exception
     if exception:
-        result += f"For _{exception.executor}_ on _{exception.project_name}_ at stage _{exception.stage}_ \n"
-        result += f"\n\n{exception}\n\n"
+        parts.append(
+            f"For _{exception.executor}_ on _{exception.project_name}_ at stage _{exception.stage}_ \n"
+        )
+        parts.append(f"\n\n{exception}\n\n")
     elif run_result.failed_results:
         failed_projects = ", ".join(
             set(failed.project.name for failed in run_result.failed_results)
@@ -110,10 +118,11 @@ def execution_plan_as_markdown(run_result: RunResult):
         failed_outputs = ". \n\n".join(
             [failed.output.message for failed in run_result.failed_results]
         )
-        result += f"For _{failed_projects}_ at stage _{failed_stage}_ \n"
-        result += f"\n\n{failed_outputs}\n\n"
+        parts.append(f"For _{failed_projects}_ at stage _{failed_stage}_ \n")
+        parts.append(f"\n\n{failed_outputs}\n\n")
     for stage in run_result.run_properties.stages:
-        result += markdown_for_stage(run_result, stage)
+        parts.append(markdown_for_stage(run_result, stage))
+    result = "".join(parts)
     if result == "":
         return "🤷 Nothing to do"
     return result
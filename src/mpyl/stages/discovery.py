@@ -6,12 +6,14 @@ import hashlib
 import logging
 import os
 import pickle
+from bisect import bisect_right
+from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TypeVar
 
 from ..constants import RUN_ARTIFACTS_FOLDER
-from ..project import Project
+from ..project import Project, ProjectHeader
 from ..project import Stage
 from ..project_execution import ProjectExecution
 from ..run_plan import RunPlan
@@ -19,6 +21,7 @@ from ..steps import deploy
 from ..steps.collection import StepsCollection
 from ..steps.models import Output, ArtifactType
 from ..utilities.repo import Changeset, Repository
+from .prefix_index import PrefixIndex
 
 
 @dataclass(frozen=True)
@@ -31,15 +34,6 @@ def file_belongs_to_project(project: Project, path: str) -> bool:
     return path.startswith(str(project.root_path))
 
 
-def is_file_in_project(logger: logging.Logger, project: Project, path: str) -> bool:
-    if file_belongs_to_project(project, path):
-        logger.debug(
-            f"Project {project.name} added to the run plan because project file was modified: {path}"
-        )
-        return True
-    return False
-
-
 def is_file_a_dependency(
     logger: logging.Logger,
     project: Project,
@@ -51,15 +45,37 @@ def is_file_a_dependency(
     if not deps:
         return False
 
-    touched_stages: set[str] = {
-        dep_stage
-        for dep_stage, dependencies in deps.all().items()
-        if len([d for d in dependencies if path.startswith(d)]) > 0
+    touched_stages: dict[str, str] = {
+        dep_stage: path
+        for dep_stage, prefixes in deps.prefixes().items()
+        if _starts_with_any(path, prefixes)
     }
 
+    return is_dependency_touched(logger, project, stage, touched_stages, steps)
+
+
+def _starts_with_any(path: str, sorted_prefixes: tuple[str, ...]) -> bool:
+    index = bisect_right(sorted_prefixes, path)
+    return index > 0 and path.startswith(sorted_prefixes[index - 1])
+
+
+def is_dependency_touched(
+    logger: logging.Logger,
+    project: Project,
+    stage: str,
+    touched_stages: dict[str, str],
+    steps: Optional[StepsCollection],
+) -> bool:
+    """
+    :param touched_stages: the stages for which a dependency of `project` was modified, mapped to a modified path
+    """
+    if not touched_stages:
+        return False
+
     if stage in touched_stages:
         logger.debug(
-            f"Project {project.name} added to the run plan because a {stage} dependency was modified: {path}"
+            f"Project {project.name} added to the run plan because a {stage} dependency was modified: "
+            f"{touched_stages[stage]}"
         )
         return True
 
@@ -90,6 +106,37 @@ def is_file_a_dependency(
     return False
 
 
+_Indexable = TypeVar("_Indexable", Project, ProjectHeader)
+
+
+def _index_changes(
+    projects: set[_Indexable], files_touched: set[str], with_dependencies: bool = True
+) -> tuple[dict[_Indexable, list[str]], dict[_Indexable, dict[str, str]]]:
+    """
+    Matches all touched files against the root paths and dependencies of all projects in one pass.
+    :return: the modified projects, mapped to their modified paths in sorted order, and for each project the
+    stages of which a dependency was modified, mapped to a modified path
+    """
+    index: PrefixIndex[tuple[_Indexable, Optional[str]]] = PrefixIndex()
+    for project in projects:
+        index.add(str(project.root_path), (project, None))
+        if with_dependencies and project.dependencies:
+            for stage, dependencies in project.dependencies.all().items():
+                for dependency in dependencies:
+                    index.add(dependency, (project, stage))
+
+    modified_projects: dict[_Indexable, list[str]] = {}
+    touched_dependencies: dict[_Indexable, dict[str, str]] = {}
+    for path in sorted(files_touched):
+        for project, dep_stage in index.matches(path):
+            if dep_stage is None:
+                modified_projects.setdefault(project, []).append(path)
+            else:
+                touched_dependencies.setdefault(project, {}).setdefault(dep_stage, path)
+
+    return modified_projects, touched_dependencies
+
+
 def is_project_cached_for_stage(
     logger: logging.Logger,
     project: str,
@@ -141,17 +188,11 @@ def is_project_cached_for_stage(
     return cached
 
 
-def _hash_changes_in_project(
-    project: Project,
-    changeset: Changeset,
-) -> Optional[str]:
-    files_to_hash = set(
-        filter(
-            lambda changed_file: file_belongs_to_project(project, changed_file),
-            changeset.files_touched(status={"A", "M", "R", "C"}),
-        )
-    )
+HASHED_CHANGE_TYPES = {"A", "M", "R", "C"}
+"""Git change types of the files that are included in the hash of a project's changes"""
+
 
+def _hash_files(files_to_hash: frozenset[str]) -> Optional[str]:
     if len(files_to_hash) == 0:
         return None
 
@@ -168,16 +209,32 @@ def _hash_changes_in_project(
     return sha256.hexdigest()
 
 
+def prefetch_outputs(
+    projects: set[Project], stage: str
+) -> dict[Project, Optional[Output]]:
+    """Reads the outputs of the previous run of `stage` for all `projects` in one batch"""
+    ordered = list(projects)
+    outputs = Output.try_read_all([project.target_path for project in ordered], stage)
+    return dict(zip(ordered, outputs))
+
+
 def to_project_executions(
     logger: logging.Logger,
     projects: set[Project],
     stage: str,
     changeset: Changeset,
 ) -> set[ProjectExecution]:
+    outputs = prefetch_outputs(projects, stage)
+    changes_to_hash, _ = _index_changes(
+        projects,
+        changeset.files_touched(status=HASHED_CHANGE_TYPES),
+        with_dependencies=False,
+    )
+
     def to_project_execution(
         project: Project,
     ) -> ProjectExecution:
-        hashed_changes = _hash_changes_in_project(project=project, changeset=changeset)
+        hashed_changes = _hash_files(frozenset(changes_to_hash.get(project, [])))
 
         return ProjectExecution.create(
             project=project,
@@ -185,7 +242,7 @@ def to_project_executions(
                 logger=logger,
                 project=project.name,
                 stage=stage,
-                output=Output.try_read(project.target_path, stage),
+                output=outputs[project],
                 hashed_changes=hashed_changes,
             ),
             hashed_changes=hashed_changes,
@@ -194,6 +251,20 @@ def to_project_executions(
     return set(map(to_project_execution, projects))
 
 
+def find_candidate_headers(
+    headers: set[ProjectHeader], stage: str, changeset: Changeset
+) -> set[ProjectHeader]:
+    """
+    A cheap preselection for `find_projects_to_execute`, based on project headers only. The projects it will
+    return are all among the candidates, so only those need to be fully loaded.
+    """
+    modified_projects, touched_dependencies = _index_changes(
+        {header for header in headers if header.has_stage(stage)},
+        changeset.files_touched(),
+    )
+    return set(modified_projects) | set(touched_dependencies)
+
+
 def find_projects_to_execute(
     logger: logging.Logger,
     all_projects: set[Project],
@@ -201,20 +272,34 @@ def find_projects_to_execute(
     changeset: Changeset,
     steps: Optional[StepsCollection],
 ) -> set[ProjectExecution]:
+    projects_for_stage = {
+        project for project in all_projects if project.has_stage(stage)
+    }
+    modified_projects, touched_dependencies = _index_changes(
+        projects_for_stage, changeset.files_touched()
+    )
+    outputs = prefetch_outputs(set(modified_projects), stage)
+    hashable_files = changeset.files_touched(status=HASHED_CHANGE_TYPES)
+
+    def hash_changes_in_project(project: Project) -> Optional[str]:
+        return _hash_files(
+            frozenset(
+                path for path in modified_projects[project] if path in hashable_files
+            )
+        )
+
     def build_project_execution(
         project: Project,
     ) -> Optional[ProjectExecution]:
-        if project.stages.for_stage(stage) is None:
-            return None
-
-        is_any_dependency_modified = any(
-            is_file_a_dependency(logger, project, stage, changed_file, steps)
-            for changed_file in changeset.files_touched()
-        )
-        is_project_modified = any(
-            is_file_in_project(logger, project, changed_file)
-            for changed_file in changeset.files_touched()
+        is_any_dependency_modified = is_dependency_touched(
+            logger, project, stage, touched_dependencies.get(project, {}), steps
         )
+        is_project_modified = project in modified_projects
+        if is_project_modified:
+            logger.debug(
+                f"Project {project.name} added to the run plan because project file was modified: "
+                f"{modified_projects[project][0]}"
+            )
 
         if is_any_dependency_modified:
             logger.debug(
@@ -222,19 +307,14 @@ def find_projects_to_execute(
                 f"modified"
             )
 
-            if is_project_modified:
-                hashed_changes = _hash_changes_in_project(
-                    project=project, changeset=changeset
-                )
-            else:
-                hashed_changes = None
+            hashed_changes = (
+                hash_changes_in_project(project) if is_project_modified else None
+            )
 
             return ProjectExecution.run(project, hashed_changes)
 
         if is_project_modified:
-            hashed_changes = _hash_changes_in_project(
-                project=project, changeset=changeset
-            )
+            hashed_changes = hash_changes_in_project(project)
 
             return ProjectExecution.create(
                 project=project,
@@ -242,7 +322,7 @@ def find_projects_to_execute(
                     logger=logger,
                     project=project.name,
                     stage=stage,
-                    output=Output.try_read(project.target_path, stage),
+                    output=outputs[project],
                     hashed_changes=hashed_changes,
                 ),
                 hashed_changes=hashed_changes,
@@ -252,7 +332,7 @@ def find_projects_to_execute(
 
     return {
         project_execution
-        for project_execution in map(build_project_execution, all_projects)
+        for project_execution in map(build_project_execution, projects_for_stage)
         if project_execution is not None
     }
 
@@ -325,26 +405,23 @@ def _discover_run_plan(
     )
 
     plan = {}
+    stage_index = index_projects_by_stage(
+        selected_projects if selected_projects and not build_all else all_projects
+    )
 
     def add_projects_to_plan(stage: Stage):
-        if build_all:
-            project_executions = to_project_executions(
-                logger=logger,
-                projects=for_stage(all_projects, stage),
-                stage=stage.name,
-                changeset=changeset,
-            )
-        elif selected_projects:
+        projects_for_stage = stage_index.get(stage.name, set())
+        if build_all or selected_projects:
             project_executions = to_project_executions(
                 logger=logger,
-                projects=for_stage(selected_projects, stage),
+                projects=projects_for_stage,
                 stage=stage.name,
                 changeset=changeset,
             )
         else:
             project_executions = find_projects_to_execute(
                 logger=logger,
-                all_projects=all_projects,
+                all_projects=projects_for_stage,
                 stage=stage.name,
                 changeset=changeset,
                 steps=StepsCollection(logger=logging.getLogger()),
@@ -364,8 +441,14 @@ def _discover_run_plan(
     return RunPlan.from_plan(plan)
 
 
-def for_stage(projects: set[Project], stage: Stage) -> set[Project]:
-    return {p for p in projects if p.stages.for_stage(stage.name)}
+def index_projects_by_stage(projects: set[Project]) -> dict[str, set[Project]]:
+    """Groups `projects` by the names of the stages they define a step for"""
+    stage_index: dict[str, set[Project]] = defaultdict(set)
+    for project in projects:
+        for stage_name, step in project.stages.all().items():
+            if step:
+                stage_index[stage_name].add(project)
+    return stage_index
 
 
 def _get_changes(
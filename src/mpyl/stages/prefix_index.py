@@ -0,0 +1,24 @@
+"""Index of string prefixes, used to find all projects affected by a changed file in a single lookup."""
+
+from typing import Generic, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+class PrefixIndex(Generic[T]):
+    """Maps prefixes to values. A path is looked up by probing each distinct prefix length once, so the cost of a
+    lookup does not grow with the number of registered prefixes."""
+
+    def __init__(self) -> None:
+        self._values: dict[str, list[T]] = {}
+        self._lengths: set[int] = set()
+
+    def add(self, prefix: str, value: T) -> None:
+        self._values.setdefault(prefix, []).append(value)
+        self._lengths.add(len(prefix))
+
+    def matches(self, path: str) -> Iterator[T]:
+        """Yields the values of all prefixes that `path` starts with"""
+        for length in self._lengths:
+            if length <= len(path):
+                yield from self._values.get(path[:length], [])
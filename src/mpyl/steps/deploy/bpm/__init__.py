@@ -1,10 +1,10 @@
 """Bpm deployment related helper methods"""
 
 from logging import Logger
-import os
 
 from ....utilities.subprocess import custom_check_output
 from ..bpm.camunda_modeler_client import CamundaModelerClient
+from ..bpm.diagrams import find_diagrams
 from ..bpm.modeler import deploy_diagram_to_modeler
 from ....utilities.bpm import CamundaConfig
 from ....utilities.http_client.exceptions import HTTPRequestError, AuthorizationError
@@ -16,12 +16,8 @@ def deploy_to_cluster(
 ) -> Output:
     bpm_file_path = config.deployment_path.bpm_diagram_folder_path
 
-    for file_name in (
-        [fn for fn in os.listdir(bpm_file_path) if fn.endswith(".bpmn")]
-        if os.path.isdir(bpm_file_path)
-        else []
-    ):
-        relative_file_path = os.path.join(bpm_file_path, file_name)
+    for diagram in find_diagrams(bpm_file_path):
+        relative_file_path = diagram.path
 
         logger.info(f"Deploying {relative_file_path}")
 
@@ -0,0 +1,18 @@
+"""Lookup of the BPMN diagrams of a project"""
+
+import os
+
+
+def find_diagrams(bpm_file_path: str) -> list[os.DirEntry]:
+    """
+    :return: the `.bpmn` files directly in `bpm_file_path`, or none if the folder does not exist
+    """
+    try:
+        with os.scandir(bpm_file_path) as entries:
+            return [
+                entry
+                for entry in entries
+                if entry.name.endswith(".bpmn") and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
@@ -1,11 +1,11 @@
 """Camunda modeler related methods to deploy diagrams"""
 
-import os
 from collections import namedtuple
 from datetime import datetime
 from logging import Logger
 
 from .camunda_modeler_client import CamundaModelerClient
+from .diagrams import find_diagrams
 from ....project import Target
 from ....utilities.bpm import CamundaConfig
 
@@ -19,15 +19,10 @@ def deploy_diagram_to_modeler(
     client: CamundaModelerClient,
     pr_number: str,
 ) -> None:
-    for file_name in (
-        [fn for fn in os.listdir(bpm_file_path) if fn.endswith(".bpmn")]
-        if os.path.isdir(bpm_file_path)
-        else []
-    ):
-        logger.info(f"Updating diagram: {file_name}")
-        file_info = get_file_data(file_name, config.project_id, client)
-        file_path = os.path.join(bpm_file_path, file_name)
-        update_diagram(file_path, file_info, client)
+    for diagram in find_diagrams(bpm_file_path):
+        logger.info(f"Updating diagram: {diagram.name}")
+        file_info = get_file_data(diagram.name, config.project_id, client)
+        update_diagram(diagram.path, file_info, client)
         if config.target == Target.PULL_REQUEST_BASE:
             create_milestone(file_info, pr_number, client)
 
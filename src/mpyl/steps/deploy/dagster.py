@@ -1,6 +1,7 @@
 """
 Step to deploy a dagster user code repository to k8s
 """
+from concurrent.futures import ThreadPoolExecutor
 from functools import reduce
 from logging import Logger
 from pathlib import Path
@@ -60,6 +61,14 @@ class DeployDagster(Step):
             message=f"{acc.message}\n{curr.message}",
         )
 
+    def __add_and_update_repo(self, dagster_config: DagsterConfig) -> List[Output]:
+        result = helm.add_repo(
+            self._logger, dagster_config.base_namespace, Constants.HELM_CHART_REPO
+        )
+        if not result.success:
+            return [result]
+        return [result, helm.update_repo(self._logger)]
+
     # pylint: disable=R0914
     def execute(self, step_input: Input) -> Output:
         """
@@ -76,24 +85,21 @@ class DeployDagster(Step):
         core_api = client.CoreV1Api()
         apps_api = client.AppsV1Api()
 
-        dagster_version = get_version_of_deployment(
-            apps_api=apps_api,
-            namespace=dagster_config.base_namespace,
-            deployment=dagster_config.webserver,
-            version_label="app.kubernetes.io/version",
-        )
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # the version is looked up in the cluster while helm fetches the chart repository
+            version_lookup = executor.submit(
+                get_version_of_deployment,
+                apps_api=apps_api,
+                namespace=dagster_config.base_namespace,
+                deployment=dagster_config.webserver,
+                version_label="app.kubernetes.io/version",
+            )
+            repo_results = self.__add_and_update_repo(dagster_config)
+            dagster_version = version_lookup.result()
         self._logger.info(f"Dagster Version: {dagster_version}")
 
-        result = helm.add_repo(
-            self._logger, dagster_config.base_namespace, Constants.HELM_CHART_REPO
-        )
-        dagster_deploy_results.append(result)
-        if not result.success:
-            return self.__evaluate_results(dagster_deploy_results)
-
-        result = helm.update_repo(self._logger)
-        dagster_deploy_results.append(result)
-        if not result.success:
+        dagster_deploy_results.extend(repo_results)
+        if not repo_results[-1].success:
             return self.__evaluate_results(dagster_deploy_results)
 
         name_suffix = get_name_suffix(properties)
@@ -127,7 +133,7 @@ class DeployDagster(Step):
         helm_install_result = helm.install_chart_with_values(
             logger=self._logger,
             dry_run=step_input.dry_run,
-            values_path=values_path / Path("values.yaml"),
+            values_path=values_path / "values.yaml",
             release_name=release_name,
             chart_version=dagster_version,
             chart_name=Constants.CHART_NAME,
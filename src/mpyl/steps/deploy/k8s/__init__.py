@@ -2,6 +2,7 @@
 
 import datetime
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from logging import Logger
 from pathlib import Path
@@ -269,14 +270,32 @@ def deploy_helm_chart(  # pylint: disable=too-many-locals
         run_properties, project
     )
 
-    upsert_namespace(
-        logger=logger,
-        namespace=namespace,
-        project_id=project_id,
-        dry_run=dry_run,
-        run_properties=run_properties,
-        cluster_config=cluster_config,
-    )
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # looking up the existing release does not depend on the namespace, so it is done while the namespace is
+        # upserted. It is only uninstalled once the namespace is in place.
+        existing_release = (
+            executor.submit(
+                helm.release_exists,
+                logger,
+                release_name,
+                namespace,
+                cluster_config.context,
+            )
+            if delete_existing
+            else None
+        )
+        upsert_namespace(
+            logger=logger,
+            namespace=namespace,
+            project_id=project_id,
+            dry_run=dry_run,
+            run_properties=run_properties,
+            cluster_config=cluster_config,
+        )
+        if existing_release and existing_release.result():
+            removed = helm.uninstall(release_name, namespace, cluster_config.context)
+            if not removed.success:
+                return removed
 
     return helm.install(
         logger,
@@ -285,7 +304,6 @@ def deploy_helm_chart(  # pylint: disable=too-many-locals
         release_name,
         namespace,
         cluster_config.context,
-        delete_existing,
     )
 
 
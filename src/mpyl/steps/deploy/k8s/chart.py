@@ -526,9 +526,11 @@ class ChartBuilder:
             if configured and configured.get_value(self.target):
                 white_lists = white_lists + configured.get_value(self.target)
 
-            return dict(
-                filter(lambda x: x[0] in white_lists, address_dictionary.items())
-            )
+            return {
+                name: addresses
+                for name, addresses in address_dictionary.items()
+                if name in white_lists
+            }
 
         return [
             HostWrapper(
@@ -767,7 +769,7 @@ class ChartBuilder:
     @staticmethod
     def extract_raw_env(target: Target, env: list[KeyValueProperty]):
         raw_env_vars = {
-            e.key: e.get_value(target) for e in env if e.get_value(target) is not None
+            e.key: value for e in env if (value := e.get_value(target)) is not None
         }
         return raw_env_vars
 
@@ -2,9 +2,15 @@
 step.
 """
 
+import json
+import os
 import shutil
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from logging import Logger
 from pathlib import Path
+from typing import Optional
 
 import yaml
 
@@ -13,6 +19,11 @@ from ...models import RunProperties, Output
 from ....cli import get_version
 from ....utilities.subprocess import custom_check_output
 
+try:
+    from yaml import CSafeDumper as ValuesDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as ValuesDumper  # type: ignore[assignment]
+
 
 def to_chart_metadata(chart_name: str, run_properties: RunProperties):
     mpyl_version = get_version()
@@ -29,14 +40,72 @@ appVersion: "{run_properties.versioning.identifier}"
 
 GENERATED_WARNING = """# This file was generated by MPyL. DO NOT EDIT DIRECTLY."""
 
+TEMPLATE_WRITERS = 8
+"""Number of chart templates that are written to disk concurrently"""
+
+
+REPO_UPDATE_TTL_SECONDS = 300
+"""How long the local helm repository index is considered up to date after a `helm repo update`"""
+
+
+class _RepoCache:
+    """Remembers which helm repositories were added and when they were last updated by this process, so that
+    deploying several projects from the same repository does not shell out to helm for each of them
+    """
+
+    def __init__(self) -> None:
+        self.added: set[tuple[str, str]] = set()
+        self.updated_at: Optional[float] = None
+
+    def is_up_to_date(self) -> bool:
+        return (
+            self.updated_at is not None
+            and time.monotonic() - self.updated_at < REPO_UPDATE_TTL_SECONDS
+        )
+
+
+_repo_cache = _RepoCache()
+
 
 def add_repo(logger: Logger, repo_name: str, repo_url: str) -> Output:
-    cmd_add = f"helm repo add {repo_name} {repo_url}"
-    return custom_check_output(logger, cmd_add)
+    if (repo_name, repo_url) in _repo_cache.added:
+        return Output(success=True, message=f"Helm repo {repo_name} already added")
+    output = custom_check_output(logger, ["helm", "repo", "add", repo_name, repo_url])
+    if output.success:
+        _repo_cache.added.add((repo_name, repo_url))
+        _repo_cache.updated_at = None
+    return output
 
 
 def update_repo(logger: Logger) -> Output:
-    return custom_check_output(logger, "helm repo update")
+    if _repo_cache.is_up_to_date():
+        return Output(success=True, message="Helm repos already up to date")
+    output = custom_check_output(logger, ["helm", "repo", "update"])
+    if output.success:
+        _repo_cache.updated_at = time.monotonic()
+    return output
+
+
+def _write_atomically(path: Path, content: str) -> None:
+    """Writes `content` next to `path` first and then swaps it in, so that a concurrent `helm template`, or the
+    next run after an interrupted one, never reads a partially written file. The temporary name starts with an
+    underscore, which helm treats as a partial that renders nothing."""
+    temporary = path.with_name(f"_{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        temporary.write_text(content, encoding="utf-8")
+        os.replace(temporary, path)
+    except OSError:
+        temporary.unlink(missing_ok=True)
+        raise
+
+
+def _write_if_changed(path: Path, content: str) -> None:
+    try:
+        if path.read_text(encoding="utf-8") == content:
+            return
+    except FileNotFoundError:
+        pass
+    _write_atomically(path, content)
 
 
 def write_chart(
@@ -44,43 +113,101 @@ def write_chart(
     chart_path: Path,
     chart_metadata: str,
     values: dict[str, str],
+    force: bool = False,
 ) -> None:
-    shutil.rmtree(chart_path, ignore_errors=True)
-    template_path = chart_path / Path("templates")
+    """
+    Writes the chart to `chart_path`. Templates whose content did not change since the previous write are left
+    untouched, and templates that are no longer part of the chart are removed.
+    :param force: remove everything in `chart_path` and write the chart from scratch
+    """
+    if force:
+        shutil.rmtree(chart_path, ignore_errors=True)
+    template_path = chart_path / "templates"
     template_path.mkdir(parents=True, exist_ok=True)
+    for existing in template_path.iterdir():
+        if existing.name not in chart:
+            if existing.is_dir():
+                shutil.rmtree(existing)
+            else:
+                existing.unlink()
+
+    _write_atomically(chart_path / "Chart.yaml", chart_metadata)
+    _write_atomically(
+        chart_path / "values.yaml",
+        (
+            yaml.dump(values, Dumper=ValuesDumper)
+            if values
+            else "# This file is intentionally left empty. All values in /templates have been pre-interpolated"
+        ),
+    )
 
-    with open(chart_path / Path("Chart.yaml"), mode="w+", encoding="utf-8") as file:
-        file.write(chart_metadata)
-    with open(chart_path / Path("values.yaml"), mode="w+", encoding="utf-8") as file:
-        if values == {}:
-            file.write(
-                "# This file is intentionally left empty. All values in /templates have been pre-interpolated"
+    with ThreadPoolExecutor(max_workers=TEMPLATE_WRITERS) as executor:
+        writes = [
+            executor.submit(
+                _write_if_changed,
+                template_path / name,
+                f"{GENERATED_WARNING}\n{to_yaml(resource)}",
             )
-        else:
-            file.write(yaml.dump(values))
+            for name, resource in chart.items()
+        ]
+        for write in writes:
+            write.result()
 
-    my_dictionary: dict[str, str] = dict(
-        map(lambda item: (item[0], to_yaml(item[1])), chart.items())
-    )
 
-    for name, template_content in my_dictionary.items():
-        with open(template_path / name, mode="w+", encoding="utf-8") as file:
-            file.write(f"{GENERATED_WARNING}\n{template_content}")
+def _release_names(helm_list_output: str) -> set[str]:
+    """
+    :param helm_list_output: the output of `helm list -o json`, possibly preceded by warnings that helm wrote to stderr
+    :return: the names of the listed releases
+    """
+    lines = helm_list_output.strip().splitlines()
+    if not lines:
+        return set()
+    try:
+        return {release["name"] for release in json.loads(lines[-1])}
+    except (ValueError, TypeError, KeyError):
+        return set()
 
 
-def __remove_existing_chart(
+def release_exists(
     logger: Logger, chart_name: str, name_space: str, kube_context: str
-) -> Output:
+) -> bool:
     found_chart = custom_check_output(
         logger,
-        f"helm list -f ^{chart_name}$ -n {name_space} --kube-context {kube_context}",
+        [
+            "helm",
+            "list",
+            "-f",
+            f"^{chart_name}$",
+            "-n",
+            name_space,
+            "--kube-context",
+            kube_context,
+            "-o",
+            "json",
+        ],
         capture_stdout=True,
     )
-    if chart_name in found_chart.message:
-        cmd = (
-            f"helm uninstall {chart_name} -n {name_space} --kube-context {kube_context}"
-        )
-        return custom_check_output(Logger("helm"), cmd)
+    return found_chart.success and chart_name in _release_names(found_chart.message)
+
+
+def uninstall(chart_name: str, name_space: str, kube_context: str) -> Output:
+    cmd = [
+        "helm",
+        "uninstall",
+        chart_name,
+        "-n",
+        name_space,
+        "--kube-context",
+        kube_context,
+    ]
+    return custom_check_output(Logger("helm"), cmd)
+
+
+def __remove_existing_chart(
+    logger: Logger, chart_name: str, name_space: str, kube_context: str
+) -> Output:
+    if release_exists(logger, chart_name, name_space, kube_context):
+        return uninstall(chart_name, name_space, kube_context)
     return Output(
         success=True, message=f"No existing chart {chart_name} found to delete"
     )
@@ -102,10 +229,10 @@ def write_helm_chart(
 
 
 def template(logger: Logger, chart_path: Path, name_space: str) -> Path:
-    cmd = f"helm template -n {name_space} {chart_path}"
+    cmd = ["helm", "template", "-n", name_space, str(chart_path)]
     output = custom_check_output(logger, cmd, capture_stdout=True)
     template_file = chart_path / "template.yml"
-    template_file.write_text(f"{GENERATED_WARNING}\n{output.message}")
+    template_file.write_text(f"{GENERATED_WARNING}\n{output.message}", encoding="utf-8")
     return template_file
 
 
@@ -115,14 +242,21 @@ def __execute_install_cmd(
     chart_name: str,
     name_space: str,
     kube_context: str,
-    additional_args: str = "",
+    additional_args: list[str],
 ) -> Output:
-    cmd = f"helm upgrade -i {chart_name} -n {name_space} --kube-context {kube_context} {additional_args}"
+    cmd = [
+        "helm",
+        "upgrade",
+        "-i",
+        chart_name,
+        "-n",
+        name_space,
+        "--kube-context",
+        kube_context,
+        *additional_args,
+    ]
     if dry_run:
-        cmd = (
-            f"helm upgrade -i {chart_name} -n {name_space} --kube-context {kube_context} {additional_args} "
-            f"--debug --dry-run"
-        )
+        cmd += ["--debug", "--dry-run"]
     return custom_check_output(logger, cmd)
 
 
@@ -145,7 +279,7 @@ def install(
         chart_name,
         name_space,
         kube_context,
-        additional_args=str(chart_path),
+        additional_args=[str(chart_path)],
     )
 
 
@@ -159,7 +293,7 @@ def install_chart_with_values(
     namespace: str,
     kube_context: str,
 ) -> Output:
-    values_path_arg = f"-f {values_path} --version {chart_version} {chart_name}"
+    values_path_arg = ["-f", str(values_path), "--version", chart_version, chart_name]
     return __execute_install_cmd(
         logger,
         dry_run,
@@ -3,11 +3,13 @@ Custom Resource Definitions, allow you to create custom k8s resources, besides t
 This is useful for example when you want to configure a specific operator, like Spark or sealed secrets.
 """
 import pkgutil
+from functools import lru_cache
 from typing import Optional
 
-import jsonschema
 import six
-from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 from kubernetes.client import Configuration, V1ObjectMeta
 from ruamel.yaml import YAML
 
@@ -109,20 +111,18 @@ def to_dict(obj, skip_none=False):
         value = getattr(obj, attr)
         key = obj.attribute_map.get(attr)
         if isinstance(value, list):
-            result[key] = list(
-                map(lambda x: to_dict(x) if hasattr(x, "to_dict") else x, value)
-            )
+            result[key] = [to_dict(x) if hasattr(x, "to_dict") else x for x in value]
         elif hasattr(value, "to_dict"):
             result[key] = to_dict(value, skip_none)
         elif isinstance(value, dict):
-            result[key] = dict(  # type: ignore
-                map(
-                    lambda item: (item[0], to_dict(item[1], skip_none))
-                    if hasattr(item[1], "to_dict")
-                    else item,
-                    value.items(),
+            result[key] = {  # type: ignore
+                item_key: (
+                    to_dict(item_value, skip_none)
+                    if hasattr(item_value, "to_dict")
+                    else item_value
                 )
-            )
+                for item_key, item_value in value.items()
+            }
         elif value is None:
             if not skip_none:
                 result[key] = value  # type: ignore
@@ -131,6 +131,18 @@ def to_dict(obj, skip_none=False):
     return result
 
 
+@lru_cache(maxsize=None)
+def _load_validator(schema_name: str) -> Optional[Validator]:
+    """Parses and checks the bundled schema `schema_name` once, instead of for every resource that uses it"""
+    template = pkgutil.get_data(__name__, f"schema/{schema_name}")
+    if not template:
+        return None
+    schema = yaml.load(template.decode("utf-8"))
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
 def to_yaml(resource: object) -> str:
     def remove_none(obj):
         if isinstance(obj, (list, tuple, set)):
@@ -151,15 +163,13 @@ def to_yaml(resource: object) -> str:
     yaml_values = remove_none(resource_dict)
 
     if hasattr(resource, "schema") and resource.schema:
-        template = pkgutil.get_data(__name__, f"schema/{resource.schema}")
-        if template:
-            schema = yaml.load(template.decode("utf-8"))
-            try:
-                jsonschema.validate(yaml_values, schema)
-            except ValidationError as err:
+        validator = _load_validator(resource.schema)
+        if validator:
+            err = best_match(validator.iter_errors(yaml_values))
+            if err:
                 raise ValueError(
                     f'Schema validation failed with {err.message} at {".".join(map(str, err.schema_path))}'
-                ) from err
+                )
         else:
             raise ValueError(
                 f"Schema {resource.schema} defined but not found in package"
@@ -1,12 +1,15 @@
 """ Model representation of run-specific configuration. """
 
 import pkgutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Optional, cast, Type
+from typing import Optional, cast, Type, Iterable
 
 from ruamel.yaml import YAML, yaml_object  # type: ignore
+from ruamel.yaml.constructor import RoundTripConstructor, SafeConstructor  # type: ignore
 
 from ..project import Project, Stage, Target
 from ..project_execution import ProjectExecution
@@ -16,6 +19,41 @@ from ..validation import validate
 yaml = YAML()
 
 
+class _OutputConstructor(SafeConstructor):
+    """Constructs the classes registered with `yaml_object` without keeping the comments and layout that
+    the round trip loader preserves. Outputs are machine written."""
+
+    synced_constructors = 0
+    """The number of round trip constructors at the last time their tags were copied"""
+
+
+_output_loader = YAML(typ="safe", pure=False)
+_output_loader.Constructor = _OutputConstructor
+_output_tags_lock = threading.Lock()
+
+
+def _sync_output_tags() -> None:
+    """Classes get registered on the round trip constructor as their modules are imported. Their tags are
+    copied over only when constructors were added since the last sync."""
+    constructors = RoundTripConstructor.yaml_constructors
+    if len(constructors) == _OutputConstructor.synced_constructors:
+        return
+    with _output_tags_lock:
+        for tag, constructor in list(constructors.items()):
+            if (
+                isinstance(tag, str)
+                and tag.startswith("!")
+                and tag not in _OutputConstructor.yaml_constructors
+            ):
+                _OutputConstructor.add_constructor(tag, constructor)
+        _OutputConstructor.synced_constructors = len(constructors)
+
+
+def _load_output(content: str):
+    _sync_output_tags()
+    return _output_loader.load(content)
+
+
 @dataclass(frozen=True)
 class VersioningProperties:
     revision: str
@@ -257,13 +295,32 @@ class Output:
         with Output.path(target_path, stage).open(mode="w+", encoding="utf-8") as file:
             yaml.dump(self, file)
 
+    @staticmethod
+    def _try_read_text(target_path: Path, stage: str) -> Optional[str]:
+        try:
+            return Output.path(target_path, stage).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
     @staticmethod
     def try_read(target_path: Path, stage: str):
-        path = Output.path(target_path, stage)
-        if path.exists():
-            with open(path, encoding="utf-8") as file:
-                return yaml.load(file)
-        return None
+        content = Output._try_read_text(target_path, stage)
+        return _load_output(content) if content else None
+
+    @staticmethod
+    def try_read_all(
+        target_paths: Iterable[Path], stage: str
+    ) -> list[Optional["Output"]]:
+        """Reads the outputs in all `target_paths` at once. The files are read concurrently, but parsed one
+        after the other because the shared loader is not thread safe."""
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            contents = list(
+                executor.map(
+                    lambda target_path: Output._try_read_text(target_path, stage),
+                    target_paths,
+                )
+            )
+        return [_load_output(content) if content else None for content in contents]
 
 
 def input_to_artifact(
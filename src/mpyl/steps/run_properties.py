@@ -100,9 +100,8 @@ def _create_run_plan(
         selected_stage = None
 
     if cli_parameters.projects:
-        selected_projects = {
-            p for p in all_projects if p.name in cli_parameters.projects.split(",")
-        }
+        selected_names = set(cli_parameters.projects.split(","))
+        selected_projects = {p for p in all_projects if p.name in selected_names}
     else:
         selected_projects = set()
 
@@ -0,0 +1,52 @@
+"""
+Memoized wrapper around `mpyl.utilities.pyaml_env.parse_config`. A parsed config is reused for as long as the
+file on disk keeps the same modification time and size.
+"""
+import copy
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from ..pyaml_env import parse_config
+
+MAX_CACHED_CONFIGS = 100
+
+_CACHE: OrderedDict[str, tuple[int, int, dict]] = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def _cached_config(key: str, stat: os.stat_result) -> Optional[dict]:
+    with _CACHE_LOCK:
+        cached = _CACHE.get(key)
+        if not cached or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+            return None
+        _CACHE.move_to_end(key)
+    return copy.deepcopy(cached[2])
+
+
+def _cache_config(key: str, stat: os.stat_result, parsed: dict) -> None:
+    with _CACHE_LOCK:
+        _CACHE[key] = (stat.st_mtime_ns, stat.st_size, parsed)
+        _CACHE.move_to_end(key)
+        if len(_CACHE) > MAX_CACHED_CONFIGS:
+            _CACHE.popitem(last=False)
+
+
+def load_config_cached(path: Path) -> dict:
+    """Parse the config at `path`, or return a copy of the cached result if the file is unchanged."""
+    key = str(Path(path).resolve())
+    stat = os.stat(key)
+    cached = _cached_config(key, stat)
+    if cached is not None:
+        return cached
+
+    parsed = parse_config(Path(key))
+    _cache_config(key, stat, parsed)
+    return copy.deepcopy(parsed)
+
+
+def clear_config_cache() -> None:
+    with _CACHE_LOCK:
+        _CACHE.clear()
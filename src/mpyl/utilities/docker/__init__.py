@@ -2,8 +2,11 @@
 
 import json
 import logging
+import queue
 import shlex
 import shutil
+import threading
+import time
 from dataclasses import dataclass
 from enum import Enum
 from logging import Logger
@@ -105,11 +108,21 @@ class DockerConfig:
 
     @staticmethod
     def from_dict(config: dict):
+        """
+        Parses the `docker` section of `config`. Every step of a run parses the same config, so the result is
+        remembered per section object. Like the rest of the run properties, the section is not expected to change
+        after it has been loaded.
+        """
         try:
-            registries: dict = config["docker"]["registries"]
-            build_config: dict = config["docker"]["build"]
-            return DockerConfig(
-                default_registry=config["docker"]["defaultRegistry"],
+            docker_config: dict = config["docker"]
+            cached = _parsed_docker_configs.get(id(docker_config))
+            if cached and cached[0] is docker_config:
+                return cached[1]
+
+            registries: dict = docker_config["registries"]
+            build_config: dict = docker_config["build"]
+            parsed = DockerConfig(
+                default_registry=docker_config["defaultRegistry"],
                 registries=[DockerRegistryConfig.from_dict(r) for r in registries],
                 root_folder=build_config["rootFolder"],
                 build_target=build_config.get("buildTarget", None),
@@ -119,6 +132,16 @@ class DockerConfig:
         except KeyError as exc:
             raise KeyError(f"Docker config could not be loaded from {config}") from exc
 
+        if len(_parsed_docker_configs) >= _MAX_PARSED_DOCKER_CONFIGS:
+            _parsed_docker_configs.clear()
+        # the section is kept alive along with the result, so its id cannot be reused while it is cached
+        _parsed_docker_configs[id(docker_config)] = (docker_config, parsed)
+        return parsed
+
+
+_MAX_PARSED_DOCKER_CONFIGS = 16
+_parsed_docker_configs: dict[int, tuple[dict, DockerConfig]] = {}
+
 
 @dataclass(frozen=True)
 class Provider(Enum):
@@ -128,38 +151,98 @@ class Provider(Enum):
 
 
 def execute_with_stream(
-    logger: Logger, container: Container, command: str, task_name: str
+    logger: Logger,
+    container: Container,
+    command: Union[str, list[str]],
+    task_name: str,
 ):
+    """
+    :param command: the command to execute, either as a shell-like string or, to skip tokenizing it, as a list of
+    arguments
+    """
+    if isinstance(command, str):
+        command = shlex.split(command)
     result = cast(
         Iterator[tuple[str, bytes]],
-        container.execute(command=shlex.split(command), stream=True),
+        container.execute(command=command, stream=True),
     )
     result_list = stream_docker_logging(logger, result, task_name)
 
     return result_list
 
 
+LOG_BATCH_SIZE = 32
+LOG_BATCH_SECONDS = 0.1
+
+_END_OF_OUTPUT = object()
+
+
+def _read_output(
+    generator: Union[Iterator[str], Iterator[tuple[str, bytes]]], items: queue.Queue
+) -> None:
+    try:
+        for next_item in generator:
+            items.put(next_item)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        items.put(exc)
+    finally:
+        items.put(_END_OF_OUTPUT)
+
+
 def stream_docker_logging(
     logger: Logger,
     generator: Union[Iterator[str], Iterator[tuple[str, bytes]]],
     task_name: str,
     level=logging.INFO,
 ) -> list[str]:
-    copied_logs = []
+    """
+    Logs the output of `generator` while collecting it. Lines are logged in batches of up to `LOG_BATCH_SIZE` lines,
+    or of the lines that arrived within `LOG_BATCH_SECONDS`, to limit the number of log records for chatty output.
+    The output is read on a separate thread, so that a batch is also flushed when the output goes quiet.
+    :return: all lines of the output
+    """
+    copied_logs: list[str] = []
+    batch: list[str] = []
+    batch_deadline = 0.0
+
+    def flush() -> None:
+        if batch:
+            logger.log(
+                level, try_parse_ansi("\n".join(line.rstrip("\r\n") for line in batch))
+            )
+            batch.clear()
+
+    items: queue.Queue = queue.Queue()
+    threading.Thread(target=_read_output, args=(generator, items), daemon=True).start()
 
     while True:
         try:
-            next_item = next(generator)
-            log_line = (
-                next_item[1].decode(errors="replace")
-                if isinstance(next_item, tuple)
-                else next_item
+            next_item = items.get(
+                timeout=max(0.0, batch_deadline - time.monotonic()) if batch else None
             )
-            copied_logs.append(log_line)
-            logger.log(level, try_parse_ansi(log_line))
-        except StopIteration:
-            logger.info(f"{task_name} complete.")
-            return copied_logs
+        except queue.Empty:
+            flush()
+            continue
+        if next_item is _END_OF_OUTPUT:
+            break
+        if isinstance(next_item, Exception):
+            flush()
+            raise next_item
+        log_line = (
+            next_item[1].decode(errors="replace")
+            if isinstance(next_item, tuple)
+            else next_item
+        )
+        copied_logs.append(log_line)
+        if not batch:
+            batch_deadline = time.monotonic() + LOG_BATCH_SECONDS
+        batch.append(log_line)
+        if len(batch) >= LOG_BATCH_SIZE:
+            flush()
+
+    flush()
+    logger.info(f"{task_name} complete.")
+    return copied_logs
 
 
 def docker_image_tag(step_input: Input) -> str:
@@ -7,6 +7,9 @@ from rich.markup import escape
 
 def try_parse_ansi(text: str):
     escaped = escape(text)
+    if "\x1b" not in escaped and "\r" not in escaped:
+        # nothing to decode, which holds for most lines. Split lines like `Text.from_ansi` does
+        return Text("\n".join(escaped.splitlines()))
     try:
         return Text.from_ansi(escaped)
     except ConsoleError:
@@ -1,8 +1,10 @@
 """Utilities related to launching a subprocess"""
 
+import logging
+import shlex
 import subprocess
 from logging import Logger
-from typing import Union
+from typing import Callable, Union
 
 from ..logging import try_parse_ansi
 from ...steps.models import Output
@@ -10,6 +12,15 @@ from ...steps.models import Output
 SUBPROCESS_FAILED = "Subprocess failed"
 
 
+def __line_emitter(logger: Logger, use_print: bool) -> Callable[[str], None]:
+    """Decides once per subprocess, rather than for every line of its output, where that output goes"""
+    if use_print:
+        return print
+    if logger.isEnabledFor(logging.INFO):
+        return lambda line: logger.info(try_parse_ansi(line))
+    return lambda _: None
+
+
 def custom_check_output(
     logger: Logger,
     command: Union[str, list[str]],
@@ -25,7 +36,7 @@ def custom_check_output(
     if isinstance(command, str):
         command = command.split(" ")
 
-    command_argument = " ".join(command)
+    command_argument = shlex.join(command)
     logger.info(f"Executing: '{command_argument}'")
     logger = logger.getChild("Subprocess")
 
@@ -44,11 +55,9 @@ def custom_check_output(
                     f"Process {command_argument} does not have an stdout"
                 )
 
+            emit = __line_emitter(logger, use_print)
             for line in process.stdout:
-                if use_print:
-                    print(line.rstrip())
-                else:
-                    logger.info(try_parse_ansi(line.rstrip()))
+                emit(line.rstrip())
 
             success = process.wait() == 0
             if not success:
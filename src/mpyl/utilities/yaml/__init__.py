@@ -1,6 +1,7 @@
 """Utilities for working with YAML files."""
 from io import StringIO
 from pathlib import Path
+from typing import Optional
 
 from ruamel.yaml import YAML
 from ruamel.yaml.compat import ordereddict
@@ -20,9 +21,13 @@ def yaml_for_roundtrip() -> YAML:
     return yaml
 
 
-def load_for_roundtrip(project_file: Path) -> tuple[ordereddict, YAML]:
-    """Load a YAML file for roundtrip editing, altering the original file as little as possible."""
-    yaml = yaml_for_roundtrip()
+def load_for_roundtrip(
+    project_file: Path, yaml: Optional[YAML] = None
+) -> tuple[ordereddict, YAML]:
+    """Load a YAML file for roundtrip editing, altering the original file as little as possible.
+    Pass in a `yaml` instance created by `yaml_for_roundtrip` to reuse it across files.
+    """
+    yaml = yaml or yaml_for_roundtrip()
     with project_file.open(encoding="utf-8") as file:
         dictionary = yaml.load(file)
         return dictionary, yaml
@@ -1,8 +1,13 @@
 """ Function used to validate the project.schema.yml against the local schema."""
 
+import hashlib
+import json
 import pkgutil
+import threading
+from collections import OrderedDict
 from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 import jsonschema
 from jsonschema.validators import Draft7Validator
@@ -13,6 +18,11 @@ from .constants import DEFAULT_STAGES_SCHEMA_FILE_NAME
 
 yaml = YAML()
 
+MAX_REMEMBERED_VALIDATIONS = 256
+
+_validated: OrderedDict[tuple[str, str, Path], None] = OrderedDict()
+_validated_lock = threading.Lock()
+
 
 def __load_schema_from_local(local_uri: str) -> Resource:
     project_schema_string = pkgutil.get_data(__name__, f"schema/{local_uri}")
@@ -70,6 +80,39 @@ def load_schema(schema_string: str, root_dir: Path) -> Draft7Validator:
     return extended_validator(schema=schema, registry=registry)
 
 
+def _digest(value: str) -> str:
+    return hashlib.sha1(value.encode("utf-8")).hexdigest()
+
+
+def _validation_key(
+    values: dict, schema_string: str, root_dir: Path
+) -> Optional[tuple[str, str, Path]]:
+    try:
+        serialized = json.dumps(
+            values, sort_keys=True, default=lambda o: f"{type(o).__name__}:{o}"
+        )
+    except TypeError:  # keys of mixed types cannot be sorted
+        return None
+    return _digest(serialized), _digest(schema_string), root_dir
+
+
 def validate(values: dict, schema_string: str, root_dir=Path(".")):
+    """
+    Validates `values` against the schema in `schema_string`. Successful validations are remembered by the content
+    of `values`, so that validating the same configuration again, e.g. when run properties are constructed for each
+    step, costs a serialization instead of a full schema walk.
+    """
+    key = _validation_key(values, schema_string, root_dir)
+    with _validated_lock:
+        if key is not None and key in _validated:
+            _validated.move_to_end(key)
+            return
+
     schema = load_schema(schema_string, root_dir)
-    return schema.validate(values)
+    schema.validate(values)
+
+    if key is not None:
+        with _validated_lock:
+            _validated[key] = None
+            if len(_validated) > MAX_REMEMBERED_VALIDATIONS:
+                _validated.popitem(last=False)
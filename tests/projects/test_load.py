@@ -1,9 +1,12 @@
+import shutil
 import traceback
 from pathlib import Path
+from unittest.mock import patch
 
 import jsonschema
 
-from src.mpyl.project import load_project
+from src.mpyl import project as project_module
+from src.mpyl.project import load_project, Dependencies, Stages
 from src.mpyl.projects import ProjectWithDependents
 from src.mpyl.projects.find import load_projects, find_dependencies
 from tests.test_resources import test_data
@@ -30,3 +33,47 @@ class TestProjectLoad:
             assert len(dependencies) == 11
             assert len(deps["job"].dependent_projects) == 1
             assert len(deps["sbtservice"].dependent_projects) == 0
+
+    def test_load_project_reuses_parse_of_unchanged_file(self, tmp_path):
+        resources = test_data.resource_path
+        shutil.copy(resources / "mpyl_stages.schema.yml", tmp_path)
+        shutil.copy(resources / "test_projects" / "test_project.yml", tmp_path)
+        project_file = tmp_path / "test_project.yml"
+
+        with patch(
+            "src.mpyl.project._load_project", wraps=project_module._load_project
+        ) as parse:
+            strict = load_project(tmp_path, Path(project_file.name), True)
+            cached = load_project(tmp_path, Path(project_file.name), False)
+            assert parse.call_count == 1
+
+        assert cached is not strict
+        assert cached.deployment is not None and strict.deployment is not None
+        cached.deployment.properties.env.clear()
+        reloaded = load_project(tmp_path, Path(project_file.name), False)
+        assert reloaded.deployment is not None
+        assert reloaded.deployment.properties.env == strict.deployment.properties.env
+        assert len(reloaded.deployment.properties.env) == 3
+
+        changed = project_file.read_text("utf-8").replace(
+            "name: 'dockertest'", "name: 'changed'", 1
+        )
+        project_file.write_text(changed, encoding="utf-8")
+        assert load_project(tmp_path, Path(project_file.name), False).name == "changed"
+
+
+def test_dependency_prefixes_drop_nested_paths():
+    dependencies = Dependencies(
+        {"build": {"projects/b/", "projects/a/src/", "projects/a/"}, "test": None}
+    )
+    assert dependencies.prefixes() == {
+        "build": ("projects/a/", "projects/b/"),
+        "test": (),
+    }
+
+
+def test_has_stage():
+    stages = Stages({"build": "Echo Build", "test": None})
+    assert stages.has("build")
+    assert not stages.has("test")
+    assert not stages.has("deploy")
@@ -4,6 +4,7 @@ from deepdiff import DeepDiff
 
 from src.mpyl.projects.versioning import (
     upgrade_file,
+    upgrade_files,
     get_entry_upgrader_index,
     PROJECT_UPGRADERS,
     load_for_roundtrip,
@@ -80,3 +81,12 @@ class TestVersioning:
         assert_roundtrip(
             self.diff_path / "formatting_after.yml", yaml_to_string(formatting, yaml)
         )
+
+    def test_upgrade_files_matches_sequential_upgrade(self):
+        sources = [
+            self.upgrades_path / "test_project_1_0_8.yml",
+            self.upgrades_path / self.latest_release_file,
+        ]
+        assert upgrade_files(sources, PROJECT_UPGRADERS) == [
+            upgrade_file(source, PROJECT_UPGRADERS) for source in sources
+        ]
@@ -8,12 +8,14 @@ from typing import Optional
 from ruamel.yaml import YAML  # type: ignore
 
 from src.mpyl.constants import RUN_ARTIFACTS_FOLDER
-from src.mpyl.project import load_project, Stage
+from src.mpyl.project import load_project, load_project_header, Stage
 from src.mpyl.projects.find import load_projects
 from src.mpyl.stages.discovery import (
+    find_candidate_headers,
     find_projects_to_execute,
     is_project_cached_for_stage,
     is_file_a_dependency,
+    index_projects_by_stage,
 )
 from src.mpyl.steps import ArtifactType
 from src.mpyl.steps import Output
@@ -357,3 +359,32 @@ class TestDiscovery:
             # as the env variables are not key value pair, they are a bit tricky to merge
             # 1 in overriden-project and 1 in parent project
             # assert(len(projects_for_deploy.pop().deployment.properties.env) == 2)
+
+    def test_index_projects_by_stage(self):
+        stage_index = index_projects_by_stage(self.projects)
+        for stage in (build.STAGE_NAME, test.STAGE_NAME, deploy.STAGE_NAME):
+            assert stage_index.get(stage, set()) == {
+                p for p in self.projects if p.stages.for_stage(stage)
+            }
+
+    def test_candidate_headers_contain_all_projects_to_execute(self):
+        with test_data.get_repo() as repo:
+            touched_files = {
+                "tests/projects/overriden-project/file.py": "A",
+                "tests/projects/job/file.py": "D",
+            }
+            changeset = Changeset("revision", touched_files)
+            project_paths = repo.find_projects()
+            projects = load_projects(repo.root_dir, project_paths)
+            headers = {
+                load_project_header(repo.root_dir, Path(path)) for path in project_paths
+            }
+            for stage in (build.STAGE_NAME, test.STAGE_NAME, deploy.STAGE_NAME):
+                candidates = find_candidate_headers(headers, stage, changeset)
+                to_execute = find_projects_to_execute(
+                    self.logger, projects, stage, changeset, self.steps
+                )
+                assert {p.project.path for p in to_execute} <= {
+                    c.path for c in candidates
+                }
+                assert len(candidates) < len(headers)
@@ -0,0 +1,18 @@
+from src.mpyl.stages.prefix_index import PrefixIndex
+
+
+class TestPrefixIndex:
+    def test_matches_all_nested_prefixes(self):
+        index: PrefixIndex[str] = PrefixIndex()
+        index.add("projects/", "root")
+        index.add("projects/a/", "a")
+        index.add("projects/ab/", "ab")
+        index.add("projects/a/", "a-dependency")
+
+        assert set(index.matches("projects/a/file.py")) == {
+            "root",
+            "a",
+            "a-dependency",
+        }
+        assert set(index.matches("projects/ab/file.py")) == {"root", "ab"}
+        assert not set(index.matches("other/file.py"))
@@ -0,0 +1,17 @@
+from pathlib import Path
+
+from src.mpyl.steps.deploy.bpm.diagrams import find_diagrams
+
+
+def test_find_diagrams(tmp_path: Path):
+    (tmp_path / "process.bpmn").write_text("<definitions/>", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("", encoding="utf-8")
+    (tmp_path / "nested.bpmn").mkdir()
+
+    assert [diagram.name for diagram in find_diagrams(str(tmp_path))] == [
+        "process.bpmn"
+    ]
+
+
+def test_find_diagrams_in_missing_folder(tmp_path: Path):
+    assert not find_diagrams(str(tmp_path / "missing"))
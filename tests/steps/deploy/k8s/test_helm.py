@@ -1,10 +1,20 @@
+import logging
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from src.mpyl.run_plan import RunPlan
-from src.mpyl.steps import Input
+from src.mpyl.steps import Input, Output
 from src.mpyl.steps.deploy.k8s.chart import ChartBuilder, to_service_chart
-from src.mpyl.steps.deploy.k8s.helm import write_chart, to_chart_metadata
+from src.mpyl.steps.deploy.k8s import helm
+from src.mpyl.steps.deploy.k8s.helm import (
+    write_chart,
+    to_chart_metadata,
+    _release_names,
+    _write_if_changed,
+)
 from tests.test_resources import test_data
 from tests.test_resources.test_data import (
     TestStage,
@@ -31,3 +41,66 @@ class TestHelm:
                 to_chart_metadata("chart_name", test_data.RUN_PROPERTIES),
                 {},
             )
+
+    def test_rewrite_chart_only_touches_changed_templates(self, tmp_path: Path):
+        step_input = Input(
+            project_execution=get_project_execution(),
+            run_properties=test_data.RUN_PROPERTIES,
+            required_artifact=test_data.get_output().produced_artifact,
+            dry_run=True,
+        )
+        chart = to_service_chart(ChartBuilder(step_input))
+        metadata = to_chart_metadata("chart_name", test_data.RUN_PROPERTIES)
+        write_chart(chart, tmp_path, metadata, {})
+
+        templates = tmp_path / "templates"
+        stale = templates / "removed-resource"
+        stale.write_text("stale", encoding="utf-8")
+        modified_times = {
+            template.name: template.stat().st_mtime_ns
+            for template in templates.iterdir()
+            if template != stale
+        }
+
+        write_chart(chart, tmp_path, metadata, {})
+
+        assert not stale.exists()
+        assert {
+            template.name: template.stat().st_mtime_ns
+            for template in templates.iterdir()
+        } == modified_times
+
+    def test_interrupted_write_leaves_previous_template(self, tmp_path: Path):
+        template = tmp_path / "deployment"
+        _write_if_changed(template, "previous")
+
+        with patch.object(helm.os, "replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                _write_if_changed(template, "next")
+
+        assert template.read_text(encoding="utf-8") == "previous"
+        assert [path.name for path in tmp_path.iterdir()] == ["deployment"]
+
+    def test_release_names(self):
+        output = (
+            "WARNING: Kubernetes configuration file is group-readable.\n"
+            '[{"name":"dockertest","namespace":"pr-1234","status":"deployed"}]\n'
+        )
+        assert _release_names(output) == {"dockertest"}
+        assert not _release_names("[]\n")
+        assert not _release_names("")
+
+    def test_repo_commands_run_once(self):
+        logger = logging.getLogger()
+        with patch.object(helm, "_repo_cache", helm._RepoCache()), patch.object(
+            helm, "custom_check_output", return_value=Output(success=True, message="")
+        ) as check_output:
+            assert helm.add_repo(
+                logger, "dagster", "https://dagster-io.github.io"
+            ).success
+            assert helm.update_repo(logger).success
+            assert helm.add_repo(
+                logger, "dagster", "https://dagster-io.github.io"
+            ).success
+            assert helm.update_repo(logger).success
+            assert check_output.call_count == 2
@@ -1,16 +1,25 @@
 import os
+from dataclasses import dataclass
+from pathlib import Path
 
 import pytest
 from jsonschema import ValidationError
-from ruamel.yaml import YAML  # type: ignore
+from ruamel.yaml import YAML, yaml_object  # type: ignore
 
 from src.mpyl.constants import (
     DEFAULT_CONFIG_FILE_NAME,
     DEFAULT_RUN_PROPERTIES_FILE_NAME,
 )
 from src.mpyl.run_plan import RunPlan
-from src.mpyl.steps.models import VersioningProperties
+from src.mpyl.steps.models import (
+    Artifact,
+    ArtifactSpec,
+    ArtifactType,
+    Output,
+    VersioningProperties,
+)
 from src.mpyl.steps.run_properties import construct_run_properties
+from src.mpyl.utilities.junit import JunitTestSpec, TestRunSummary
 from src.mpyl.utilities.pyaml_env import parse_config
 from tests import root_test_path
 
@@ -61,3 +70,51 @@ class TestModels:
             None,
         )
         assert properties.validate() == "Either pr_number or tag need to be set"
+
+    def test_output_survives_write_and_read(self, tmp_path: Path):
+        output = Output(
+            success=True,
+            message="Tests results produced",
+            produced_artifact=Artifact(
+                artifact_type=ArtifactType.JUNIT_TESTS,
+                revision="123",
+                producing_step="Sbt Test",
+                spec=JunitTestSpec(
+                    test_output_path="target/test-reports",
+                    test_results_summary=TestRunSummary(
+                        tests=3, failures=0, errors=0, skipped=1
+                    ),
+                ),
+            ),
+        )
+        output.write(tmp_path, "test")
+
+        assert Output.try_read(tmp_path, "test") == output
+        assert Output.try_read_all([tmp_path, tmp_path / "missing"], "test") == [
+            output,
+            None,
+        ]
+
+    def test_output_with_spec_registered_after_first_read(self, tmp_path: Path):
+        output = Output(success=True, message="first")
+        output.write(tmp_path, "build")
+        assert Output.try_read(tmp_path, "build") == output
+
+        @yaml_object(YAML())
+        @dataclass
+        class LateSpec(ArtifactSpec):
+            yaml_tag = "!LateSpec"
+            location: str
+
+        late = Output(
+            success=True,
+            message="late",
+            produced_artifact=Artifact(
+                artifact_type=ArtifactType.NONE,
+                revision="123",
+                producing_step="step",
+                spec=LateSpec(location="somewhere"),
+            ),
+        )
+        late.write(tmp_path, "build")
+        assert Output.try_read(tmp_path, "build") == late
@@ -1,4 +1,5 @@
 import pkgutil
+from unittest.mock import patch
 
 from src.mpyl.validation import validate
 from tests import test_resource_path
@@ -13,3 +14,18 @@ class TestValidation:
 
         assert schema_dict is not None
         validate(config_values, schema_dict.decode("utf-8"), test_resource_path)
+
+    def test_remembers_successful_validation(self):
+        schema_dict = pkgutil.get_data(
+            __name__, "../src/mpyl/schema/mpyl_config.schema.yml"
+        )
+        assert schema_dict is not None
+        schema = schema_dict.decode("utf-8")
+        validate(config_values, schema, test_resource_path)
+
+        with patch("src.mpyl.validation.load_schema") as load_schema:
+            validate(config_values, schema, test_resource_path)
+            load_schema.assert_not_called()
+
+            validate({**config_values, "other": "value"}, schema, test_resource_path)
+            load_schema.assert_called_once()
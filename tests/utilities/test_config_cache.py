@@ -0,0 +1,28 @@
+import os
+import shutil
+from pathlib import Path
+
+from src.mpyl.utilities.config_cache import load_config_cached, clear_config_cache
+from tests import root_test_path
+
+
+class TestConfigCache:
+    resource_path = root_test_path / "test_resources"
+
+    def test_returns_independent_copies(self):
+        clear_config_cache()
+        first = load_config_cached(self.resource_path / "env_replace.yml")
+        first["root"]["key2"] = "mutated"
+        second = load_config_cached(self.resource_path / "env_replace.yml")
+        assert second["root"]["key2"] == "fallback"
+
+    def test_reparses_changed_file(self, tmp_path: Path):
+        clear_config_cache()
+        config_file = tmp_path / "config.yml"
+        shutil.copy(self.resource_path / "env_replace.yml", config_file)
+        assert load_config_cached(config_file)["root"]["key2"] == "fallback"
+
+        config_file.write_text("root:\n  key2: changed\n", encoding="utf-8")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert load_config_cached(config_file)["root"]["key2"] == "changed"
@@ -1,8 +1,17 @@
+import copy
+import logging
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
 from src.mpyl.utilities.docker import (
     DockerConfig,
     docker_registry_path,
     ecr_repository_path,
     registry_for_project,
+    stream_docker_logging,
+    LOG_BATCH_SIZE,
 )
 
 from tests.test_resources.test_data import get_config_values, get_project
@@ -23,3 +32,51 @@ class TestDocker:
         default_registry = registry_for_project(conf, get_project())
         host_name = f"{default_registry}/repo/project"
         assert ecr_repository_path(host_name, "JOB:pr-392") == "repo/project/job"
+
+    def test_stream_docker_logging_batches_lines(self):
+        logger = MagicMock(spec=logging.Logger)
+        lines = [f"line {i}\n" for i in range(LOG_BATCH_SIZE + 1)]
+        stream = iter([("stdout", line.encode()) for line in lines])
+
+        with patch("src.mpyl.utilities.docker.LOG_BATCH_SECONDS", 60):
+            assert stream_docker_logging(logger, stream, "task") == lines
+        assert logger.log.call_count == 2
+        first_batch = logger.log.call_args_list[0].args[1]
+        assert first_batch.plain == "\n".join(line.rstrip() for line in lines[:-1])
+
+    def test_stream_docker_logging_flushes_when_output_pauses(self):
+        logger = MagicMock(spec=logging.Logger)
+        resumed = threading.Event()
+        logger.log.side_effect = lambda *_: resumed.set()
+
+        def pausing_stream():
+            yield "before pause\n"
+            assert resumed.wait(timeout=10), "lines before the pause were not logged"
+            yield "after pause\n"
+
+        assert stream_docker_logging(logger, pausing_stream(), "task") == [
+            "before pause\n",
+            "after pause\n",
+        ]
+        assert [call.args[1].plain for call in logger.log.call_args_list] == [
+            "before pause",
+            "after pause",
+        ]
+
+    def test_stream_docker_logging_raises_errors_of_the_output(self):
+        logger = MagicMock(spec=logging.Logger)
+
+        def failing_stream():
+            yield "building\n"
+            raise ValueError("build failed")
+
+        with pytest.raises(ValueError, match="build failed"):
+            stream_docker_logging(logger, failing_stream(), "task")
+        assert logger.log.call_args.args[1].plain == "building"
+
+    def test_docker_config_is_parsed_once_per_config(self):
+        config_values = get_config_values()
+        conf = DockerConfig.from_dict(config_values)
+        assert DockerConfig.from_dict(config_values) is conf
+        copied = DockerConfig.from_dict(copy.deepcopy(config_values))
+        assert copied == conf and copied is not conf
@@ -1,3 +1,6 @@
+from rich.markup import escape
+from rich.text import Text
+
 from src.mpyl.utilities.logging import try_parse_ansi
 
 
@@ -6,3 +9,9 @@ class TestLogging:
         ansi = "\x1b[38;5;196mHello\x1b[0m"
         output = try_parse_ansi(ansi)
         assert output.plain == "Hello"
+
+    def test_plain_text_is_parsed_like_ansi(self):
+        for plain in ["Hello", "Hello\n", "a\n\nb", "[bold]markup[/bold]", ""]:
+            expected = Text.from_ansi(escape(plain))
+            output = try_parse_ansi(plain)
+            assert (output.plain, output.spans) == (expected.plain, expected.spans)
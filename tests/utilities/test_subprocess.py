@@ -11,3 +11,10 @@ class TestSubProcess:
     def test_should_handle_invalid_command(self):
         output = custom_check_output(logging.getLogger(), "invalidcommand")
         assert not output.success
+
+    def test_should_log_output_lines(self, caplog):
+        logger = logging.getLogger("subprocess_test")
+        with caplog.at_level(logging.INFO, logger="subprocess_test"):
+            output = custom_check_output(logger, "echo hello")
+        assert output.success
+        assert any(str(record.msg) == "hello" for record in caplog.records)